@@ -20,8 +20,17 @@ logger = logging.getLogger(__name__)
 # Thread safety lock for NeoPixel operations
 _pixel_lock = threading.Lock()
 
-# Lighting now always uses config.LED_PIN_BCM (default: 21). Pin 18 is reserved for bell.
-led_pin_to_use = config.LED_PIN_BCM
+
+def _resolve_led_pin() -> int:
+    """
+    Return the BCM pin the NeoPixel strip is driven from.
+
+    Lighting always uses config.LED_PIN_BCM (default: 21). Pin 18 is reserved for bell.
+    """
+    return config.LED_PIN_BCM
+
+
+led_pin_to_use = _resolve_led_pin()
 logger.info(
     f"Initializing NeoPixel on pin {led_pin_to_use} with {config.LED_COUNT} LEDs"
 )
@@ -17,7 +17,7 @@ __all__ = [
 import argparse
 import threading
 import logging
-import time  # Added for sleep in video-disabled loop
+import time
 
 from . import sounds, video_loop, lighting, bell
 from . import config  # Import config
@@ -102,8 +102,6 @@ def start_threads(
         threads.append(t)
         t.start()
         # Give bell thread time to initialize GPIO factory
-        import time
-
         time.sleep(0.5)
 
     if not args.no_sounds:
@@ -191,12 +189,12 @@ def handle_video_playback(
         except KeyboardInterrupt:
             return
     else:
-        # If video is disabled, wait using time.sleep so tests can patch sleep
-        while not stop_event.is_set():
-            try:
-                time.sleep(config.MAIN_LOOP_SLEEP_S)
-            except KeyboardInterrupt:
-                break
+        # If video is disabled, block on the stop event until shutdown
+        try:
+            while not stop_event.wait(config.MAIN_LOOP_SLEEP_S):
+                pass
+        except KeyboardInterrupt:
+            return
 
 
 def handle_shutdown(
@@ -1,3 +1,4 @@
+import logging
 import time
 import typing
 
@@ -15,6 +16,8 @@ else:
         GPIO.HIGH = 1
         GPIO.LOW = 0
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 MISTER_PIN = 22  # BCM numbering, change to your wiring
 
@@ -26,11 +29,11 @@ def setup() -> None:
 
 
 def trigger_mister(duration: int = 5) -> None:
-    print(f"Turning mister ON for {duration} seconds...")
+    logger.info("Turning mister ON for %s seconds...", duration)
     GPIO.output(MISTER_PIN, GPIO.HIGH)
     time.sleep(duration)
     GPIO.output(MISTER_PIN, GPIO.LOW)
-    print("Mister OFF.")
+    logger.info("Mister OFF.")
 
 
 def cleanup() -> None:
@@ -43,11 +46,12 @@ def main() -> None:
     try:
         trigger_mister(duration=5)  # Run for 5 seconds
     except KeyboardInterrupt:
-        print("Interrupted by user.")
+        logger.info("Interrupted by user.")
     finally:
         cleanup()
-        print("GPIO cleaned up.")
+        logger.info("GPIO cleaned up.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
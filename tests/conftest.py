@@ -1,17 +1,16 @@
 from typing import Optional
 import sys
-import os
+import logging
 import types
+import pygame
 import pytest
 import threading
 import time
 import random
-from typing import Any, Callable, Union
-
-PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
-SRC_DIR = os.path.join(PROJECT_ROOT, "src")
-if SRC_DIR not in sys.path:
-    sys.path.insert(0, SRC_DIR)
+from pathlib import PurePath
+from types import SimpleNamespace
+from typing import Any, Callable, NoReturn, Sequence, Union
+from unittest.mock import MagicMock, Mock
 
 
 class DummyServo:
@@ -153,49 +152,154 @@ def mock_servo() -> type:
     return DummyServo
 
 
-@pytest.fixture(autouse=False)
-def dummy_event() -> threading.Event:
+@pytest.fixture
+def dummy_event() -> MagicMock:
+    """
+    Returns a mock threading.Event whose set/clear/is_set share a flag.
+    wait() returns False by default; tests drive it via wait.side_effect.
+    """
+    event = MagicMock(spec=threading.Event)
+    state = {"set": False}
+    event.set.side_effect = lambda: state.__setitem__("set", True)
+    event.clear.side_effect = lambda: state.__setitem__("set", False)
+    event.is_set.side_effect = lambda: state["set"]
+    event.wait.return_value = False
+    return event
+
+
+class BreakLoop(Exception):
+    """Raised by test doubles to escape an otherwise endless loop."""
+
+
+def raising(exc: BaseException) -> Callable[..., NoReturn]:
+    """Returns a stand-in that raises exc whatever it is called with."""
+
+    def _raise(*args: object, **kwargs: object) -> NoReturn:
+        raise exc
+
+    return _raise
+
+
+class CountingEvent(threading.Event):
+    """
+    Event whose wait() never blocks. Each call is counted and reports a timeout
+    (False); the call numbered break_after, if given, raises BreakLoop instead.
+    """
+
+    def __init__(self, break_after: Optional[int] = None) -> None:
+        super().__init__()
+        self.break_after = break_after
+        self.wait_calls = 0
+        self.observed_timeouts: list[Optional[float]] = []
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self.wait_calls += 1
+        self.observed_timeouts.append(timeout)
+        if self.break_after is not None and self.wait_calls >= self.break_after:
+            raise BreakLoop()
+        return False
+
+
+class WaitAssertingEvent(CountingEvent):
     """
-    Returns a dummy threading.Event with controllable .wait() and .is_set().
-    Usage: pass as stop_event or patch in tests for deterministic control.
+    CountingEvent that fails the test if wait() is called without a positive
+    timeout, so a loop that starts busy-polling is caught immediately.
     """
 
-    class DummyEvent(threading.Event):
-        def __init__(self) -> None:
-            super().__init__()
-            self._is_set = False
-            self.wait_calls = 0
-            self.wait_return_value = False  # Set to True to break loops
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        assert timeout is not None and timeout > 0, f"polling wait: {timeout!r}"
+        return super().wait(timeout)
+
+
+class FakeEvent:
+    """
+    Lock-free stand-in for threading.Event for tests that never share an event
+    between threads. wait() returns the flag at once instead of blocking.
+    """
+
+    def __init__(self) -> None:
+        self._set = False
+
+    def set(self) -> None:
+        self._set = True
+
+    def clear(self) -> None:
+        self._set = False
+
+    def is_set(self) -> bool:
+        return self._set
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._set
+
+
+# Not autouse: test_main still starts real threads that block on their events.
+# Only displayboard.sounds sees FakeEvent; the threading module itself is left
+# alone, since Thread.start() and Timer rely on real Events internally.
+@pytest.fixture
+def fake_threading_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "displayboard.sounds.threading",
+        SimpleNamespace(Event=FakeEvent, Thread=threading.Thread),
+    )
+
+
+@pytest.fixture
+def mock_logger() -> MagicMock:
+    """Returns a MagicMock restricted to the logging.Logger interface."""
+    return MagicMock(spec_set=logging.Logger)
+
+
+# --- Deterministic stand-ins for time.sleep and the random functions ---
+# Defined once here rather than as lambdas inside the fixtures below, and shared
+# with test_sounds, which installs them on its module under test directly.
 
-        def set(self) -> None:
-            self._is_set = True
 
-        def is_set(self) -> bool:
-            return self._is_set
+def fake_sleep(seconds: float) -> None:
+    pass
 
-        def wait(self, timeout: Optional[float] = None) -> bool:
-            self.wait_calls += 1
-            return self.wait_return_value
 
-        def clear(self) -> None:
-            self._is_set = False
+def fake_uniform(a: float, b: float) -> float:
+    # Return the lower bound for predictable testing
+    return a
 
-    return DummyEvent()
+
+def fake_randint(a: int, b: int) -> int:
+    # Return the lower bound for predictable testing
+    return a
+
+
+def fake_choice(seq: Sequence[Any]) -> Any:
+    # Return the first element for predictable testing
+    if not seq:
+        raise IndexError("Cannot choose from an empty sequence")
+    return seq[0]
+
+
+def fake_sample(population: Sequence[Any], k: int) -> list[Any]:
+    # Return the first k elements for predictable testing
+    return list(population[:k])
+
+
+def fake_random() -> float:
+    # Return a fixed value for predictable testing
+    return 0.5
 
 
 @pytest.fixture(autouse=True)
 def patch_time_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(time, "sleep", lambda s: None)
+    monkeypatch.setattr(time, "sleep", fake_sleep)
 
 
-# Patch random functions for deterministic tests
-@pytest.fixture(autouse=True)
+# Patch random functions for deterministic tests. Not autouse: only modules that
+# exercise code calling random opt in via pytestmark.
+@pytest.fixture
 def patch_random(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(random, "uniform", lambda a, b: a)
-    monkeypatch.setattr(random, "randint", lambda a, b: a)
-    monkeypatch.setattr(random, "choice", lambda seq: seq[0] if seq else None)
-    monkeypatch.setattr(random, "sample", lambda pop, k: list(pop[:k]))
-    monkeypatch.setattr(random, "random", lambda: 0.5)
+    monkeypatch.setattr(random, "uniform", fake_uniform)
+    monkeypatch.setattr(random, "randint", fake_randint)
+    monkeypatch.setattr(random, "choice", fake_choice)
+    monkeypatch.setattr(random, "sample", fake_sample)
+    monkeypatch.setattr(random, "random", fake_random)
 
 
 @pytest.fixture(autouse=True)
@@ -275,10 +379,20 @@ def mock_neopixel(monkeypatch: pytest.MonkeyPatch) -> type:
     return DummyNeoPixel
 
 
+# Force the NeoPixel wrapper onto its hardware code path with a fake board
+@pytest.fixture(autouse=False)
+def linux_neopixel_env(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    """Returns the fake board module installed as displayboard.neopixel.board."""
+    monkeypatch.setattr(sys, "platform", "linux")
+    board = types.SimpleNamespace(D18=18, D21=21, D12=12, D10=10)
+    monkeypatch.setattr("displayboard.neopixel.HAS_NEOPIXEL", True)
+    monkeypatch.setattr("displayboard.neopixel.board", board)
+    return board
+
+
 # Mock board pin constants (e.g., board.D18)
 @pytest.fixture(autouse=False)
 def mock_board_pins(monkeypatch: pytest.MonkeyPatch) -> object:
-    import types
     import displayboard.board
 
     dummy_board = types.SimpleNamespace(D18=18, D21=21, D12=12, D13=13)
@@ -289,55 +403,101 @@ def mock_board_pins(monkeypatch: pytest.MonkeyPatch) -> object:
     return dummy_board
 
 
-# Fixture to mock pygame everywhere it's imported, with realistic mixer behavior
-@pytest.fixture(autouse=False)
-def mock_pygame(monkeypatch: pytest.MonkeyPatch) -> object:
-    from types import SimpleNamespace
-
-    # Use a static dict to avoid infinite test loops from repeated creation
-    channel_mocks = {}
-    sound_mocks = {}
-
-    from unittest.mock import MagicMock
-
-    def sound_factory(path: object) -> MagicMock:
-        if path not in sound_mocks:
-            m = MagicMock()
-            m.set_volume = MagicMock()
-            m.get_length.return_value = 0.01
-            m.play = MagicMock()
-            m._fake_path = path
-            sound_mocks[path] = m
-        return sound_mocks[path]
-
-    def channel_factory(i: int) -> MagicMock:
-        if i not in channel_mocks:
-            chan = MagicMock()
-            chan.set_volume = MagicMock()
-            chan.play = MagicMock()
-            chan.fadeout = MagicMock()
-            chan._channel_id = i
-            channel_mocks[i] = chan
-        return channel_mocks[i]
-
-    mixer = SimpleNamespace(
-        init=MagicMock(),
-        set_num_channels=MagicMock(),
-        set_reserved=MagicMock(),
-        quit=MagicMock(),
-        Sound=sound_factory,
-        Channel=channel_factory,
-        find_channel=MagicMock(return_value=channel_factory(0)),
-    )
+class FakeSound:
+    """
+    Lightweight stand-in for pygame.mixer.Sound.
+    on_play, if given, is called with the sound each time it is played.
+    """
+
+    __slots__ = ("path", "on_play")
+
+    def __init__(
+        self, path: object, on_play: Optional[Callable[["FakeSound"], None]] = None
+    ) -> None:
+        self.path = path
+        self.on_play = on_play
 
-    class FakePygameError(Exception):
+    def set_volume(self, volume: float) -> None:
         pass
 
-    mock_pygame_mod = SimpleNamespace(
-        mixer=mixer,
-        error=FakePygameError,
-        init=MagicMock(),
-    )
-    monkeypatch.setattr("displayboard.bell.pygame", mock_pygame_mod)
-    monkeypatch.setattr("displayboard.sounds.pygame", mock_pygame_mod)
-    return mock_pygame_mod
+    def get_length(self) -> float:
+        return 0.01
+
+    def play(self, *args: object, **kwargs: object) -> None:
+        if self.on_play is not None:
+            self.on_play(self)
+
+
+# --- Fake pygame, built once at import and reset before every test ---
+_channel_mocks: dict[int, Mock] = {}
+_sound_mocks: dict[object, Mock] = {}
+
+
+# Plain Mocks spec'd on the real classes: no magic-method setup per instance,
+# and a misspelt Sound/Channel method fails loudly instead of auto-creating.
+def _sound_factory(path: object) -> Mock:
+    if path not in _sound_mocks:
+        m = Mock(spec=pygame.mixer.Sound)
+        m.get_length.return_value = 0.01
+        # Real values, so tests can record what was played without mock lookups
+        m.configure_mock(path=path, path_name=PurePath(str(path)).name)
+        _sound_mocks[path] = m
+    return _sound_mocks[path]
+
+
+def _channel_factory(i: int) -> Mock:
+    if i not in _channel_mocks:
+        chan = Mock(spec=pygame.mixer.Channel)
+        chan._channel_id = i
+        _channel_mocks[i] = chan
+    return _channel_mocks[i]
+
+
+class FakePygameError(Exception):
+    pass
+
+
+_FAKE_MIXER = SimpleNamespace(
+    init=MagicMock(),
+    set_num_channels=MagicMock(),
+    set_reserved=MagicMock(),
+    quit=MagicMock(),
+    Sound=_sound_factory,
+    Channel=_channel_factory,
+    find_channel=MagicMock(),
+)
+_FAKE_PYGAME = SimpleNamespace(
+    mixer=_FAKE_MIXER,
+    error=FakePygameError,
+    init=MagicMock(),
+)
+
+
+@pytest.fixture(scope="session")
+def fake_pygame() -> SimpleNamespace:
+    """Session-wide fake pygame module; use mock_pygame to install it."""
+    return _FAKE_PYGAME
+
+
+# Fixture to mock pygame everywhere it's imported, with realistic mixer behavior
+@pytest.fixture(autouse=False)
+def mock_pygame(
+    monkeypatch: pytest.MonkeyPatch, fake_pygame: SimpleNamespace
+) -> SimpleNamespace:
+    # Start every test from fresh channel/sound mocks and clean call records
+    _channel_mocks.clear()
+    _sound_mocks.clear()
+    for m in (
+        _FAKE_MIXER.init,
+        _FAKE_MIXER.set_num_channels,
+        _FAKE_MIXER.set_reserved,
+        _FAKE_MIXER.quit,
+        _FAKE_MIXER.find_channel,
+        _FAKE_PYGAME.init,
+    ):
+        m.reset_mock(return_value=True, side_effect=True)
+    _FAKE_MIXER.find_channel.return_value = _channel_factory(0)
+
+    monkeypatch.setattr("displayboard.bell.pygame", fake_pygame)
+    monkeypatch.setattr("displayboard.sounds.pygame", fake_pygame)
+    return fake_pygame
@@ -5,6 +5,10 @@ import pytest
 from types import ModuleType
 from typing import Optional, Any
 from unittest.mock import MagicMock
+from tests.conftest import raising
+
+# bell.py picks swing counts, positions and volumes with random
+pytestmark = pytest.mark.usefixtures("patch_random")
 
 
 def test_ensure_pygame_mixer_initialized_raises(
@@ -468,7 +472,7 @@ def test_import_bell_pygame_mixer_init_fails(
     monkeypatch.setattr(
         pygame.mixer,
         "init",
-        lambda: (_ for _ in ()).throw(pygame.error("init fail")),
+        raising(pygame.error("init fail")),
     )
     # The import at the top of the file ensures bell_module is already imported and
     # tracked by coverage.
@@ -500,7 +504,7 @@ def test_start_sound_raises(
     monkeypatch.setattr(
         bell_module.pygame.mixer.music,
         "load",
-        lambda f: (_ for _ in ()).throw(pygame.error("load fail")),
+        raising(pygame.error("load fail")),
     )
     bell_module.start_sound()
     assert "Failed to play bell sound" in caplog.text
@@ -517,9 +521,7 @@ def test_stop_sound_raises(
     # Ensure mixer appears initialized
     monkeypatch.setattr(bell_module.pygame.mixer, "get_init", lambda: True)
     monkeypatch.setattr(music_mock, "get_busy", lambda: True)
-    monkeypatch.setattr(
-        music_mock, "stop", lambda: (_ for _ in ()).throw(pygame.error("stop fail"))
-    )
+    monkeypatch.setattr(music_mock, "stop", raising(pygame.error("stop fail")))
     bell_module.stop_sound()
     assert "Failed to stop bell sound" in caplog.text
 
@@ -634,7 +636,7 @@ def test_main_pygame_quit_raises_in_finally(
     monkeypatch.setattr(
         bell_module.pygame.mixer,
         "quit",
-        lambda: (_ for _ in ()).throw(pygame.error("quit fail")),
+        raising(pygame.error("quit fail")),
     )
     bell_module.main(stop_event=dummy_event)
     assert "Failed to quit pygame mixer during cleanup" in caplog.text
@@ -767,6 +769,10 @@ class DummyEvent:
         self._is_set = True
 
 
+# Shared pygame.mixer.quit mock, reset by isolate_pygame before every test
+_mixer_quit_mock = MagicMock()
+
+
 @pytest.fixture(autouse=True)
 def isolate_pygame(monkeypatch: pytest.MonkeyPatch) -> "DummyMusic":
     # Replace pygame.mixer.music with DummyMusic
@@ -774,34 +780,29 @@ def isolate_pygame(monkeypatch: pytest.MonkeyPatch) -> "DummyMusic":
     monkeypatch.setattr(pygame.mixer, "music", dummy)
     # Prevent real init/quit side effects, can be overridden in specific tests
     monkeypatch.setattr(pygame.mixer, "init", lambda: None)
-    monkeypatch.setattr(pygame.mixer, "quit", lambda: None)
+    _mixer_quit_mock.reset_mock(side_effect=True)
+    monkeypatch.setattr(pygame.mixer, "quit", _mixer_quit_mock)
     return dummy
 
 
 @pytest.fixture
 def fresh_bell_module(
-    monkeypatch: pytest.MonkeyPatch,
+    isolate_pygame: DummyMusic,
 ) -> tuple[ModuleType, ModuleType, DummyMusic]:
     """
     Fixture to reset global state and patch dependencies for bell_module.
     Does NOT reload the module, so coverage is preserved.
+    pygame.mixer is already isolated by the autouse isolate_pygame fixture.
     """
-    import pygame  # Import pygame directly to avoid attribute errors
-
     import displayboard.bell as bell_module_local
 
     # Reset global servo if it exists in the module
     if hasattr(bell_module_local, "servo"):
         setattr(bell_module_local, "servo", None)
-    # Patch pygame.mixer.music, init, quit for isolation
-    dummy_music = DummyMusic()
-    monkeypatch.setattr(pygame.mixer, "music", dummy_music)
-    monkeypatch.setattr(pygame.mixer, "init", lambda: None)
-    monkeypatch.setattr(pygame.mixer, "quit", lambda: None)
     # Patch config if needed
     import displayboard.config as config_module
 
-    return bell_module_local, config_module, dummy_music
+    return bell_module_local, config_module, isolate_pygame
 
 
 def test_start_and_stop_sound(
@@ -873,19 +874,10 @@ def test_random_trigger_loop_no_trigger(
     # > probability
     monkeypatch.setattr(bell_module.random, "random", lambda: 1.0)
 
-    event = dummy_event
-    # Do not set event, let the loop run once
-    # Patch event.wait to return True after first call to break loop
-    call_count = {"n": 0}
+    # Let the loop run once, then have wait() report the event as set
+    dummy_event.wait.side_effect = [False, True]
 
-    def wait_once(timeout: Optional[float] = None) -> bool:
-        call_count["n"] += 1
-        return call_count["n"] > 1
-
-    # Patch event.wait using monkeypatch to avoid direct assignment
-    monkeypatch.setattr(event, "wait", wait_once)
-
-    bell_module.random_trigger_loop(stop_event=event)
+    bell_module.random_trigger_loop(stop_event=dummy_event)
     # Checks log for silent bell event
     assert "...The bell remains silent..." in caplog.text
 
@@ -917,14 +909,8 @@ def test_random_trigger_loop_with_trigger(
     # Force trigger
     monkeypatch.setattr(bell_module.random, "random", lambda: 0.0)
 
-    # Patch dummy_event.wait to break the loop after one call
-    call_count = {"n": 0}
-
-    def wait_once(timeout: Optional[float] = None) -> bool:
-        call_count["n"] += 1
-        return call_count["n"] > 1
-
-    monkeypatch.setattr(dummy_event, "wait", wait_once)
+    # Break the loop after one call
+    dummy_event.wait.side_effect = [False, True]
 
     bell_module.random_trigger_loop(stop_event=dummy_event)
 
@@ -956,15 +942,8 @@ def test_main_initializes_and_cleans_up(
         "stop_sound",
         lambda *_: called_methods.__setitem__("stop_sound", True),
     )
-    # Pygame mixer quit is mocked by isolate_pygame, but we can grab it if
-    # bell.pygame.mixer.quit is what's called. However, the autouse fixture
-    # isolate_pygame already mocks pygame.mixer.quit. We need to ensure
-    # bell.py calls the globally mocked pygame.mixer.quit. For assertion,
-    # we can mock it again here if needed or rely on isolate_pygame's mock.
-    # Let's mock it directly on bell_module.pygame.mixer for clarity if
-    # main uses that specific instance.
-    pygame_quit_mock = MagicMock()
-    monkeypatch.setattr(bell_module.pygame.mixer, "quit", pygame_quit_mock)
+    # pygame.mixer.quit is the shared mock installed (and reset) by isolate_pygame
+    pygame_quit_mock = bell_module.pygame.mixer.quit
 
     bell_module.main(stop_event=dummy_event)
 
@@ -1129,8 +1108,6 @@ def test_main_servo_close_failure_in_finally(
     bell_module, _, _ = fresh_bell_module  # noqa: E501
 
     # Robust log capture: forcibly reset both displayboard.bell and bell_module.__name__ loggers
-    import logging
-
     for logger_name in ("displayboard.bell", bell_module.__name__):
         logger = logging.getLogger(logger_name)
         logger.handlers.clear()
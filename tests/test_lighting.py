@@ -7,17 +7,30 @@ import logging
 from unittest.mock import patch, MagicMock
 from typing import Generator
 from _pytest.monkeypatch import MonkeyPatch
+import displayboard.neopixel as neopixel_module
 
+# flicker_breathe draws per-pixel flicker from random
+pytestmark = pytest.mark.usefixtures("patch_random")
 
-@pytest.fixture(params=[18, 21, 99])
+
+@pytest.fixture
 def hardware_pin(request: pytest.FixtureRequest, monkeypatch: MonkeyPatch) -> int:
-    # Patch the config or board to simulate different hardware
+    # Patch the config or board to simulate different hardware.
+    # Parametrized indirectly so only tests that need a pin pay for it.
     monkeypatch.setattr("displayboard.config.LED_PIN_BCM", request.param, raising=False)
     return int(request.param)
 
 
+@pytest.mark.parametrize("hardware_pin", [18, 21, 99], indirect=True)
+def test_pin_resolution(hardware_pin: int) -> None:
+    # The helper reads config at call time, so no module reload is needed
+    import displayboard.lighting as lighting_module
+
+    assert lighting_module._resolve_led_pin() == hardware_pin
+
+
 def test_flicker_breathe_runs_and_stops(
-    mock_neopixel: MagicMock, dummy_event: MagicMock, hardware_pin: int
+    mock_neopixel: MagicMock, dummy_event: MagicMock
 ) -> None:
     stop_event = dummy_event
 
@@ -39,7 +52,7 @@ def test_flicker_breathe_runs_and_stops(
         next(time_gen)
         return False
 
-    with patch("displayboard.neopixel.NeoPixel", autospec=True) as mock_neopixel:
+    with patch.object(neopixel_module, "NeoPixel", autospec=True) as mock_neopixel:
         mock_pixels = MagicMock()
         mock_pixels.__setitem__ = MagicMock()
         mock_pixels.show = MagicMock()
@@ -49,13 +62,15 @@ def test_flicker_breathe_runs_and_stops(
         import displayboard.lighting as lighting_module
 
         importlib.reload(lighting_module)
-        with patch(
-            "displayboard.lighting.time.time", side_effect=lambda: next(time_gen)
+        with patch.object(
+            lighting_module.time, "time", side_effect=lambda: next(time_gen)
+        ), patch.multiple(
+            lighting_module.random,
+            random=MagicMock(return_value=0.1),
+            randint=MagicMock(return_value=10),
         ):
-            with patch("displayboard.lighting.random.random", return_value=0.1):
-                with patch("displayboard.lighting.random.randint", return_value=10):
-                    stop_event.wait = mock_wait
-                    lighting_module.flicker_breathe(stop_event=stop_event)
+            stop_event.wait = mock_wait
+            lighting_module.flicker_breathe(stop_event=stop_event)
         # Use the mock_pixels object for assertions,
         # not the function references
         assert mock_pixels.show.call_count > 0
@@ -67,7 +82,6 @@ def test_lighting_pin_selection_branches(
     monkeypatch: MonkeyPatch,
     mock_led_button: MagicMock,
     mock_board_pins: MagicMock,
-    hardware_pin: int,
 ) -> None:
     """
     Test pin selection logic:
@@ -75,7 +89,7 @@ def test_lighting_pin_selection_branches(
     - D18 != config.LED_PIN_BCM
     - ImportError (D18 missing)
     """
-    with patch("displayboard.neopixel.NeoPixel", autospec=True) as mock_neopixel:
+    with patch.object(neopixel_module, "NeoPixel", autospec=True) as mock_neopixel:
         mock_pixels = MagicMock()
         mock_pixels.__setitem__ = MagicMock()
         mock_pixels.show = MagicMock()
@@ -130,7 +144,7 @@ def test_lighting_pin_selection_branches(
 
 def test_flicker_breathe_finally_cleanup(dummy_event: MagicMock) -> None:
     stop_event = dummy_event
-    with patch("displayboard.neopixel.NeoPixel", autospec=True) as mock_neopixel:
+    with patch.object(neopixel_module, "NeoPixel", autospec=True) as mock_neopixel:
         mock_pixels = MagicMock()
         mock_pixels.__setitem__ = MagicMock()
         # Patch show to raise after first call
@@ -150,7 +164,7 @@ def test_flicker_breathe_finally_cleanup(dummy_event: MagicMock) -> None:
         import displayboard.lighting as lighting_module
 
         importlib.reload(lighting_module)
-        with patch("displayboard.lighting.time.time", return_value=0.0):
+        with patch.object(lighting_module.time, "time", return_value=0.0):
             try:
                 lighting_module.flicker_breathe(stop_event=stop_event)
             except Exception as e:
@@ -178,7 +192,7 @@ def test_lighting_module_init_failure_creates_stub(
         mock_instance._pixels = None  # Stub has no real pixels
         return mock_instance
 
-    with patch("displayboard.neopixel.NeoPixel", side_effect=mock_neopixel_init):
+    with patch.object(neopixel_module, "NeoPixel", side_effect=mock_neopixel_init):
         # Reload lighting module to trigger initialization
         sys.modules.pop("displayboard.lighting", None)
         import displayboard.lighting
@@ -196,12 +210,13 @@ def test_lighting_module_init_failure_creates_stub(
 def test_flicker_breathe_exits_early_when_no_hardware(
     caplog: pytest.LogCaptureFixture,
     dummy_event: MagicMock,
+    monkeypatch: MonkeyPatch,
 ) -> None:
     """Test that flicker_breathe exits early when NeoPixel hardware unavailable."""
     caplog.set_level(logging.WARNING)
 
     # Create a mock lighting module with pixels._pixels = None
-    with patch("displayboard.neopixel.NeoPixel", autospec=True) as mock_neopixel:
+    with patch.object(neopixel_module, "NeoPixel", autospec=True) as mock_neopixel:
         mock_pixels = MagicMock()
         mock_pixels._pixels = None  # Simulate no hardware
         mock_neopixel.return_value = mock_pixels
@@ -213,7 +228,7 @@ def test_flicker_breathe_exits_early_when_no_hardware(
         importlib.reload(displayboard.lighting)
 
         # Mock the global pixels object in the lighting module
-        displayboard.lighting.pixels = mock_pixels
+        monkeypatch.setattr(displayboard.lighting, "pixels", mock_pixels)
 
         # Call flicker_breathe - should exit immediately
         displayboard.lighting.flicker_breathe(stop_event=dummy_event)
@@ -2,50 +2,63 @@ import sys
 import threading
 import pytest
 from typing import Dict, Callable, Optional, Tuple, Any
-from displayboard import sounds, lighting, video_loop
+from displayboard import config, sounds, lighting, video_loop
 import displayboard.main as dispatcher
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 import os
 import subprocess
 import argparse
+import logging
+from types import SimpleNamespace
 
 
-class FakeThread:
+@pytest.fixture
+def created_threads(monkeypatch: pytest.MonkeyPatch) -> list[SimpleNamespace]:
     """
-    A fake Thread to capture target and name, without starting real threads.
+    Replace threading.Thread with a factory that records each thread and runs
+    its target synchronously on start(). Returns the per-test record list.
     """
+    created: list[SimpleNamespace] = []
 
-    instances: list["FakeThread"] = []
-
-    def __init__(
-        self,
+    def _factory(
         target: Optional[Callable[..., None]] = None,
         name: Optional[str] = None,
         daemon: Optional[bool] = None,
         args: Tuple[Any, ...] = (),
-        **kwargs: object
-    ) -> None:
-        self.target = target
-        self.name = name
-        self.daemon = daemon
-        self.args = args
-        FakeThread.instances.append(self)
-
-    def start(self) -> None:
-        if callable(self.target):
-            try:
-                if self.args:
-                    self.target(*self.args)
-                else:
-                    self.target()
-            except KeyboardInterrupt:
-                pass
+        **kwargs: object,
+    ) -> SimpleNamespace:
+        def start() -> None:
+            if callable(target):
+                try:
+                    target(*args)
+                except KeyboardInterrupt:
+                    pass
+
+        t = SimpleNamespace(
+            target=target, name=name, daemon=daemon, args=args, start=start
+        )
+        created.append(t)
+        return t
+
+    monkeypatch.setattr(threading, "Thread", _factory)
+    return created
+
+
+@pytest.fixture(scope="session")
+def default_args() -> argparse.Namespace:
+    """Parse the default command line once; tests must copy before mutating."""
+    old_argv = sys.argv
+    sys.argv = ["displayboard"]
+    try:
+        return dispatcher.parse_args()
+    finally:
+        sys.argv = old_argv
 
 
 @pytest.fixture(autouse=True)
-def patch_threads_and_calls(monkeypatch: pytest.MonkeyPatch) -> Dict[str, int]:
-    FakeThread.instances.clear()
-    monkeypatch.setattr(threading, "Thread", FakeThread)
+def patch_threads_and_calls(
+    monkeypatch: pytest.MonkeyPatch, created_threads: list[SimpleNamespace]
+) -> Dict[str, int]:
     calls = {"sounds": 0, "lighting": 0, "video": 0}
     monkeypatch.setattr(
         sounds, "main", lambda stop_event=None: calls.update(sounds=calls["sounds"] + 1)
@@ -64,28 +77,56 @@ def patch_threads_and_calls(monkeypatch: pytest.MonkeyPatch) -> Dict[str, int]:
     return calls
 
 
-def test_main_join_threads_attribute_and_runtime() -> None:
-    """Covers _join_threads AttributeError and RuntimeError branches."""
-    mock_logger = MagicMock()
+def _make_join_stub(behavior: str) -> Any:
+    """Build a thread stand-in whose join() is missing, raises, or succeeds."""
 
-    class NoJoin(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__()
-            self.name = "NoJoinThread"
+    class NoJoin:
+        name = "NoJoinThread"
 
-    class BadJoin(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__()
-            self.name = "BadJoinThread"
+    class BadJoin:
+        name = "BadJoinThread"
 
         def join(self, timeout: Optional[float] = None) -> None:
             raise RuntimeError("fail")
 
-    dispatcher._join_threads([NoJoin(), BadJoin()], mock_logger)
+    class GoodJoin:
+        name = "GoodJoinThread"
+
+        def join(self, timeout: Optional[float] = None) -> None:
+            pass
+
+    return {"no_join": NoJoin, "raises": BadJoin, "ok": GoodJoin}[behavior]()
+
+
+@pytest.mark.parametrize(
+    "behavior, level, expected",
+    [
+        pytest.param(
+            "no_join",
+            "warning",
+            "Could not join thread NoJoinThread (AttributeError).",
+            id="attributeerror",
+        ),
+        pytest.param(
+            "raises",
+            "warning",
+            "Could not join thread BadJoinThread (RuntimeError: fail).",
+            id="runtimeerror",
+        ),
+        pytest.param("ok", "debug", "Thread GoodJoinThread joined.", id="joined"),
+    ],
+)
+def test_join_threads(
+    mock_logger: MagicMock, behavior: str, level: str, expected: str
+) -> None:
+    """Covers each _join_threads outcome and the message it logs."""
+    dispatcher._join_threads([_make_join_stub(behavior)], mock_logger)
+    getattr(mock_logger, level).assert_any_call(expected)
 
 
 def test_main_keyboard_interrupt_in_video(
     monkeypatch: pytest.MonkeyPatch,
+    mock_logger: MagicMock,
 ) -> None:
     """Covers KeyboardInterrupt in handle_video_playback."""
     monkeypatch.setattr(sys, "argv", ["displayboard"])
@@ -104,7 +145,6 @@ def test_main_keyboard_interrupt_in_video(
         "start_threads",
         lambda args, stop_event: [],
     )
-    mock_logger = MagicMock()
     monkeypatch.setattr(
         dispatcher,
         "configure_logging",
@@ -115,6 +155,7 @@ def test_main_keyboard_interrupt_in_video(
 
 def test_main_keyboard_interrupt_in_shutdown(
     monkeypatch: pytest.MonkeyPatch,
+    mock_logger: MagicMock,
 ) -> None:
     """Covers KeyboardInterrupt in handle_shutdown."""
     monkeypatch.setattr(sys, "argv", ["displayboard"])
@@ -125,7 +166,6 @@ def test_main_keyboard_interrupt_in_shutdown(
     monkeypatch.setattr(dispatcher.video_loop, "main", fake_video_main)
     monkeypatch.setattr(dispatcher, "_join_threads", lambda threads, logger: None)
     monkeypatch.setattr(dispatcher, "start_threads", lambda args, stop_event: [])
-    mock_logger = MagicMock()
     monkeypatch.setattr(dispatcher, "configure_logging", lambda args: mock_logger)
 
     def fake_handle_video_playback(args: object, stop_event: object) -> None:
@@ -164,56 +204,41 @@ def test_parse_args_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
     assert not args.no_bell
 
 
-def test_configure_logging_debug(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Covers configure_logging with debug flag (line 144)."""
-    import argparse
-    import logging
-
-    args = argparse.Namespace(debug=True, verbose=False)
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
-    logger = dispatcher.configure_logging(args)
-    config = getattr(dispatcher, "config")
-    assert logger.getEffectiveLevel() == config.LOG_LEVEL_VERBOSE
+@pytest.fixture
+def clean_root_logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give the root logger a throwaway handler list and level for one test."""
+    monkeypatch.setattr(logging.root, "handlers", [])
+    monkeypatch.setattr(logging.root, "level", logging.root.level)
 
 
-def test_configure_logging_verbose(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Covers configure_logging with verbose flag (line 146)."""
-    import argparse
-    import logging
-
-    args = argparse.Namespace(debug=False, verbose=True)
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
+@pytest.mark.parametrize(
+    "verbose, debug, expected",
+    [
+        pytest.param(False, False, config.LOG_LEVEL_WARNING, id="default"),
+        pytest.param(True, False, config.LOG_LEVEL_DEFAULT, id="verbose"),
+        pytest.param(False, True, config.LOG_LEVEL_VERBOSE, id="debug"),
+    ],
+)
+def test_configure_logging_levels(
+    clean_root_logger: None, verbose: bool, debug: bool, expected: int
+) -> None:
+    """Covers each level branch of configure_logging."""
+    args = argparse.Namespace(debug=debug, verbose=verbose)
+    # Drop pytest's call-phase handlers so basicConfig takes effect
+    logging.root.handlers.clear()
     logger = dispatcher.configure_logging(args)
-    config = getattr(dispatcher, "config")
-    assert logger.getEffectiveLevel() == config.LOG_LEVEL_DEFAULT
-
-
-def test_handle_video_playback_exit_branch() -> None:
-    """Covers handle_video_playback loop exit branch (121->exit)."""
-
-    # This test is now covered by test_handle_shutdown_branches using dummy_event
-    pass
-
-
-def test_handle_shutdown_exit_branch(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Covers handle_shutdown loop exit branch (146-148)."""
-
-    # This test is now covered by test_handle_shutdown_branches using dummy_event
-    pass
+    assert logger.getEffectiveLevel() == expected
 
 
 def test_handle_shutdown_branches(
     monkeypatch: pytest.MonkeyPatch,
-    dummy_event: threading.Event,
+    dummy_event: MagicMock,
+    mock_logger: MagicMock,
+    default_args: argparse.Namespace,
 ) -> None:
     """Covers handle_shutdown loop exit and wait branches using dummy_event."""
-    # Use real parse_args for coverage
-    # Patch sys.argv to only include arguments that parse_args expects
-    monkeypatch.setattr(sys, "argv", ["displayboard"])
-    args = dispatcher.parse_args()
-    mock_logger = MagicMock()
+    # Copy the shared defaults; this test flips no_video below
+    args = argparse.Namespace(**vars(default_args))
     monkeypatch.setattr(dispatcher, "_join_threads", lambda threads, logger: None)
 
     # Exit branch: event is set before entering
@@ -222,63 +247,26 @@ def test_handle_shutdown_branches(
 
     # Wait branch: event is not set, will set after one wait
     dummy_event.clear()
-    call_count = {"wait": 0}
 
     # Force the no_video branch so stop_event.wait is called
     args.no_video = True
 
-    def fake_wait(timeout: Optional[float] = None) -> bool:
-        call_count["wait"] += 1
-        dummy_event.set()  # Exit after one call
-        return True
-
-    dummy_event.wait = fake_wait  # type: ignore
+    # Exit after one call
+    dummy_event.wait.side_effect = lambda timeout: dummy_event.set()
     dispatcher.handle_shutdown([], dummy_event, mock_logger, args)
-    assert call_count["wait"] == 1
-
-
-def test_join_threads_attributeerror(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Tests _join_threads except AttributeError branch."""
-    mock_logger = MagicMock()
-
-    class NoJoinObj(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__()
-            self.name = "NoJoinObj"
-
-    dispatcher._join_threads([NoJoinObj()], mock_logger)
-
-
-def test_configure_logging_basic(monkeypatch: pytest.MonkeyPatch) -> None:
-    """
-    Tests configure_logging default path (logging.basicConfig).
-    """
-    import argparse
-    import logging
-
-    args = argparse.Namespace(debug=False, verbose=False)
-    # Remove all handlers to avoid duplicate logs
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
-    logger = dispatcher.configure_logging(args)
-    from displayboard import config
-
-    assert logger.getEffectiveLevel() == config.LOG_LEVEL_WARNING
+    dummy_event.wait.assert_called_once_with(config.MAIN_LOOP_SLEEP_S)
 
 
 def test_configure_logging_sets_handlers(
     monkeypatch: pytest.MonkeyPatch,
+    clean_root_logger: None,
 ) -> None:
     """
     Tests configure_logging when no handlers exist, ensuring logging.basicConfig is called.
     """
-    import argparse
-    import logging
-
     args: argparse.Namespace = argparse.Namespace(debug=False, verbose=False)
     # Remove all handlers to ensure basicConfig is called
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
+    logging.root.handlers.clear()
     # Patch logging.basicConfig to track call
     called: dict[str, Any] = {}
     orig_basicConfig = logging.basicConfig
@@ -292,62 +280,18 @@ def test_configure_logging_sets_handlers(
     assert called.get("basicConfig")
 
 
-def test_configure_logging_real_basicconfig() -> None:
-    """
-    Tests configure_logging real call to logging.basicConfig.
-    """
-    import argparse
-    import logging
-
-    args = argparse.Namespace(debug=False, verbose=False)
-    # Remove all handlers to ensure basicConfig is called
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
-    logger = dispatcher.configure_logging(args)
-    config = getattr(dispatcher, "config")
-    assert logger.getEffectiveLevel() == config.LOG_LEVEL_WARNING
-
-
-def test_join_threads_debug(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Tests _join_threads normal debug branch (logger.debug)."""
-    mock_logger = MagicMock()
-    # Set logger.debug to a real function to check call
-    calls = {}
-
-    def fake_debug(msg: str) -> None:
-        calls["debug"] = msg
-
-    mock_logger.debug.side_effect = fake_debug
-
-    class GoodJoinObj(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__()
-            self.name = "GoodJoinObj"
-
-        def join(self, timeout: Optional[float] = None) -> None:
-            pass
-
-    good_join_obj: threading.Thread = GoodJoinObj()
-    dispatcher._join_threads([good_join_obj], mock_logger)
-
-
 def test_handle_shutdown_video_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
     """Covers handle_shutdown branch where video is enabled (calls video_loop.main)."""
-    import argparse
-    import threading
-    import displayboard.main as main
-    import logging
-
     called = {}
 
     def dummy_video_main(stop_event: Optional[threading.Event] = None) -> None:
         called["video"] = True
 
-    monkeypatch.setattr(main.video_loop, "main", dummy_video_main)
+    monkeypatch.setattr(dispatcher.video_loop, "main", dummy_video_main)
     args = argparse.Namespace(no_video=False)
     threads: list[threading.Thread] = []
     stop_event = threading.Event()
-    main.handle_shutdown(
+    dispatcher.handle_shutdown(
         threads, stop_event, logging.getLogger("displayboard.test"), args
     )
     assert called["video"]
@@ -357,37 +301,44 @@ def test_handle_video_playback_keyboardinterrupt(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Covers KeyboardInterrupt in handle_video_playback (video enabled)."""
-    import argparse
-    import threading
-    import displayboard.main as main
-
     args = argparse.Namespace(no_video=False)
     stop_event = threading.Event()
 
     def raise_keyboardinterrupt(stop_event: object = None) -> None:
         raise KeyboardInterrupt
 
-    monkeypatch.setattr(main.video_loop, "main", raise_keyboardinterrupt)
+    monkeypatch.setattr(dispatcher.video_loop, "main", raise_keyboardinterrupt)
     # Should not raise, just handle KeyboardInterrupt
-    main.handle_video_playback(args, stop_event)
+    dispatcher.handle_video_playback(args, stop_event)
+
+
+def test_handle_video_playback_no_video_waits(dummy_event: MagicMock) -> None:
+    """Covers handle_video_playback waiting out a timeout before the event is set."""
+    args = argparse.Namespace(no_video=True)
+    # First wait times out, the second reports the event set
+    dummy_event.wait.side_effect = [False, True]
+
+    dispatcher.handle_video_playback(args, dummy_event)
+
+    assert dummy_event.wait.call_args_list == [
+        call(config.MAIN_LOOP_SLEEP_S),
+        call(config.MAIN_LOOP_SLEEP_S),
+    ]
 
 
 def test_handle_shutdown_keyboardinterrupt(monkeypatch: pytest.MonkeyPatch) -> None:
     """Covers KeyboardInterrupt in handle_shutdown (video enabled)."""
-    import argparse
-    import threading
-    import displayboard.main as main
-    import logging
-
     args = argparse.Namespace(no_video=False)
     stop_event = threading.Event()
 
     def raise_keyboardinterrupt(stop_event: object = None) -> None:
         raise KeyboardInterrupt
 
-    monkeypatch.setattr(main.video_loop, "main", raise_keyboardinterrupt)
+    monkeypatch.setattr(dispatcher.video_loop, "main", raise_keyboardinterrupt)
     # Should not raise, just handle KeyboardInterrupt
-    main.handle_shutdown([], stop_event, logging.getLogger("displayboard.test"), args)
+    dispatcher.handle_shutdown(
+        [], stop_event, logging.getLogger("displayboard.test"), args
+    )
 
 
 def test_main_py_entry_subprocess() -> None:
@@ -410,85 +361,87 @@ def test_main_py_entry_subprocess() -> None:
     assert result.returncode == 0
 
 
-@pytest.mark.parametrize(
-    "no_sounds,no_lighting,no_bell,expected_sounds,expected_lighting,expected_bell,expected_len",
-    [
-        (False, False, False, 1, 1, 1, 3),
-        (True, False, False, 0, 1, 1, 2),
-        (False, True, False, 1, 0, 1, 2),
-        (True, True, False, 0, 0, 1, 1),
-        (False, False, True, 1, 1, 0, 2),
-        (True, False, True, 0, 1, 0, 1),
-        (False, True, True, 1, 0, 0, 1),
-        (True, True, True, 0, 0, 0, 0),
-    ],
-)
+# (id, no_sounds, no_lighting, no_bell, expected_sounds, expected_lighting,
+#  expected_bell, expected_len)
+START_THREADS_CASES = [
+    ("all", False, False, False, 1, 1, 1, 3),
+    ("no-sounds", True, False, False, 0, 1, 1, 2),
+    ("no-lighting", False, True, False, 1, 0, 1, 2),
+    ("bell-only", True, True, False, 0, 0, 1, 1),
+    ("no-bell", False, False, True, 1, 1, 0, 2),
+    ("lighting-only", True, False, True, 0, 1, 0, 1),
+    ("sounds-only", False, True, True, 1, 0, 0, 1),
+    ("none", True, True, True, 0, 0, 0, 0),
+]
+
+
 def test_start_threads_calls(
     patch_threads_and_calls: dict[str, Any],
-    no_sounds: bool,
-    no_lighting: bool,
-    no_bell: bool,
-    expected_sounds: int,
-    expected_lighting: int,
-    expected_bell: int,
-    expected_len: int,
+    created_threads: list[SimpleNamespace],
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Covers start_threads enabling/disabling sound, lighting, and bell threads."""
     # Patch bell.main to increment a counter
     import displayboard.bell
 
     bell_calls = {"bell": 0}
-    orig_bell_main = displayboard.bell.main
 
     def fake_bell_main(stop_event: Optional[Any] = None) -> None:
         bell_calls["bell"] += 1
 
-    displayboard.bell.main = fake_bell_main
-
-    args = argparse.Namespace(
-        no_sounds=no_sounds, no_lighting=no_lighting, no_bell=no_bell
-    )
-    stop_event = threading.Event()
-    threads = dispatcher.start_threads(args, stop_event)
-    assert len(threads) == expected_len
-    assert patch_threads_and_calls["sounds"] == expected_sounds
-    assert patch_threads_and_calls["lighting"] == expected_lighting
-    assert bell_calls["bell"] == expected_bell
-    displayboard.bell.main = orig_bell_main
+    monkeypatch.setattr(displayboard.bell, "main", fake_bell_main)
+
+    # One fixture setup for all flag combinations instead of one per case
+    for (
+        case_id,
+        no_sounds,
+        no_lighting,
+        no_bell,
+        expected_sounds,
+        expected_lighting,
+        expected_bell,
+        expected_len,
+    ) in START_THREADS_CASES:
+        first = len(created_threads)
+        patch_threads_and_calls.update(sounds=0, lighting=0, video=0)
+        bell_calls["bell"] = 0
+
+        args = argparse.Namespace(
+            no_sounds=no_sounds, no_lighting=no_lighting, no_bell=no_bell
+        )
+        threads = dispatcher.start_threads(args, threading.Event())
+        assert len(threads) == expected_len, case_id
+        assert patch_threads_and_calls["sounds"] == expected_sounds, case_id
+        assert patch_threads_and_calls["lighting"] == expected_lighting, case_id
+        assert bell_calls["bell"] == expected_bell, case_id
+        t_names = {t.name for t in created_threads[first:]}
+        assert ("SoundscapeThread" in t_names) == bool(expected_sounds), case_id
+        assert ("LightingThread" in t_names) == bool(expected_lighting), case_id
+        assert ("BellThread" in t_names) == bool(expected_bell), case_id
 
 
 @pytest.mark.timeout(2)
-def test_handle_video_playback_no_video_exit(monkeypatch: pytest.MonkeyPatch) -> None:
-    import time
-
+def test_handle_video_playback_no_video_exit() -> None:
     args = argparse.Namespace(no_video=True)
     stop_event = threading.Event()
     stop_event.set()
-    # Defensive: patch time.sleep to avoid any possible hang
-    monkeypatch.setattr(time, "sleep", lambda s: None)
     dispatcher.handle_video_playback(args, stop_event)
 
 
 @pytest.mark.timeout(2)
-def test_handle_video_playback_no_video_keyboardinterrupt(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_handle_video_playback_no_video_keyboardinterrupt() -> None:
     """Covers KeyboardInterrupt in disabled video playback loop."""
-
     args = argparse.Namespace(no_video=True)
     stop_event = threading.Event()
-    call = {"sleep": 0}
+    call = {"wait": 0}
 
-    def fake_sleep(interval: float) -> None:
-        call["sleep"] += 1
+    def fake_wait(timeout: Optional[float] = None) -> bool:
+        call["wait"] += 1
         raise KeyboardInterrupt
 
-    import time
-
-    # Patch the sleep function in the time module directly
-    monkeypatch.setattr(time, "sleep", fake_sleep)
+    stop_event.wait = fake_wait  # type: ignore[method-assign]
     dispatcher.handle_video_playback(args, stop_event)
-    assert call["sleep"] == 1
+    assert call["wait"] == 1
 
 
 # Remove duplicate test_handle_video_playback_video_enabled if present
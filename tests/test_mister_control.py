@@ -1,51 +1,29 @@
-import sys
+import logging
 import pytest
 from unittest import mock
 
+import displayboard.mister_control as mister_control
 
-# Use a fixture to patch sys.modules before importing mister_control
-import collections.abc
+GpioMocks = tuple[mock.MagicMock, mock.MagicMock]
 
 
 @pytest.fixture(autouse=True)
-def patch_gpio_and_time(
-    monkeypatch: pytest.MonkeyPatch,
-) -> collections.abc.Generator[tuple[mock.MagicMock, mock.MagicMock], None, None]:
-    """Fixture to patch RPi.GPIO and time before importing mister_control."""
+def patch_gpio_and_time(monkeypatch: pytest.MonkeyPatch) -> GpioMocks:
+    """Patch RPi.GPIO and time on the imported mister_control module."""
     mock_gpio = mock.MagicMock()
-    mock_time = mock.MagicMock()
+    mock_time = mock.MagicMock(spec_set=["sleep"])
     # Set constants to simple values for compatibility with implementation
     mock_gpio.BCM = 11
     mock_gpio.OUT = 0
     mock_gpio.HIGH = 1
     mock_gpio.LOW = 0
-    # Explicitly set methods to MagicMock so calls are tracked
-    mock_gpio.setmode = mock.MagicMock()
-    mock_gpio.setup = mock.MagicMock()
-    mock_gpio.output = mock.MagicMock()
-    mock_gpio.cleanup = mock.MagicMock()
-    sys.modules["RPi"] = mock.MagicMock()
-    sys.modules["RPi.GPIO"] = mock_gpio
-    sys.modules["time"] = mock_time
-    # Remove displayboard.mister_control from sys.modules before each test
-    # to force re-import with mocks
-    if "displayboard.mister_control" in sys.modules:
-        del sys.modules["displayboard.mister_control"]
-    import displayboard.mister_control as mister_control
-
-    # Patch the GPIO in the implementation directly
-    setattr(mister_control, "GPIO", mock_gpio)
-    yield mock_gpio, mock_time
-    del sys.modules["RPi"]
-    del sys.modules["RPi.GPIO"]
-    del sys.modules["time"]
-    if "displayboard.mister_control" in sys.modules:
-        del sys.modules["displayboard.mister_control"]
-
-
-def test_setup(patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock]) -> None:
+    monkeypatch.setattr(mister_control, "GPIO", mock_gpio)
+    monkeypatch.setattr(mister_control, "time", mock_time)
+    return mock_gpio, mock_time
+
+
+def test_setup(patch_gpio_and_time: GpioMocks) -> None:
     mock_gpio, _ = patch_gpio_and_time
-    import displayboard.mister_control as mister_control
 
     mister_control.setup()
     mock_gpio.setmode.assert_called_once_with(mock_gpio.BCM)
@@ -54,39 +32,36 @@ def test_setup(patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock]) -> No
 
 
 def test_trigger_mister_default_duration(
-    patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock],
-    capsys: pytest.CaptureFixture[str],
+    patch_gpio_and_time: GpioMocks,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
+    caplog.set_level(logging.INFO)
     mock_gpio, mock_time = patch_gpio_and_time
-    import displayboard.mister_control as mister_control
 
     mister_control.trigger_mister()
     mock_gpio.output.assert_any_call(mister_control.MISTER_PIN, mock_gpio.HIGH)
     mock_time.sleep.assert_called_once_with(5)
     mock_gpio.output.assert_any_call(mister_control.MISTER_PIN, mock_gpio.LOW)
-    out = capsys.readouterr().out
-    assert "Turning mister ON for 5 seconds" in out
-    assert "Mister OFF." in out
+    assert "Turning mister ON for 5 seconds" in caplog.text
+    assert "Mister OFF." in caplog.text
 
 
 def test_trigger_mister_custom_duration(
-    patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock],
-    capsys: pytest.CaptureFixture[str],
+    patch_gpio_and_time: GpioMocks,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
+    caplog.set_level(logging.INFO)
     mock_gpio, mock_time = patch_gpio_and_time
-    import displayboard.mister_control as mister_control
 
     mister_control.trigger_mister(duration=2)
     mock_gpio.output.assert_any_call(mister_control.MISTER_PIN, mock_gpio.HIGH)
     mock_time.sleep.assert_called_once_with(2)
     mock_gpio.output.assert_any_call(mister_control.MISTER_PIN, mock_gpio.LOW)
-    out = capsys.readouterr().out
-    assert "Turning mister ON for 2 seconds" in out
+    assert "Turning mister ON for 2 seconds" in caplog.text
 
 
-def test_cleanup(patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock]) -> None:
+def test_cleanup(patch_gpio_and_time: GpioMocks) -> None:
     mock_gpio, _ = patch_gpio_and_time
-    import displayboard.mister_control as mister_control
 
     mister_control.cleanup()
     mock_gpio.output.assert_any_call(mister_control.MISTER_PIN, mock_gpio.LOW)
@@ -94,45 +69,39 @@ def test_cleanup(patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock]) ->
 
 
 def test_main_normal(
-    patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock],
     monkeypatch: pytest.MonkeyPatch,
-    capsys: pytest.CaptureFixture[str],
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    import displayboard.mister_control as mister_control
-
-    setup_mock = mock.MagicMock()
-    trigger_mister_mock = mock.MagicMock()
-    cleanup_mock = mock.MagicMock()
-    mister_control.setup = setup_mock
-    mister_control.trigger_mister = trigger_mister_mock
-    mister_control.cleanup = cleanup_mock
+    caplog.set_level(logging.INFO)
+    setup_mock = mock.create_autospec(mister_control.setup)
+    trigger_mister_mock = mock.create_autospec(mister_control.trigger_mister)
+    cleanup_mock = mock.create_autospec(mister_control.cleanup)
+    monkeypatch.setattr(mister_control, "setup", setup_mock)
+    monkeypatch.setattr(mister_control, "trigger_mister", trigger_mister_mock)
+    monkeypatch.setattr(mister_control, "cleanup", cleanup_mock)
     mister_control.main()
     setup_mock.assert_called_once()
     trigger_mister_mock.assert_called_once_with(duration=5)
     cleanup_mock.assert_called_once()
-    out = capsys.readouterr().out
-    assert "GPIO cleaned up." in out
+    assert "GPIO cleaned up." in caplog.text
 
 
 def test_main_keyboard_interrupt(
-    patch_gpio_and_time: tuple[mock.MagicMock, mock.MagicMock],
     monkeypatch: pytest.MonkeyPatch,
-    capsys: pytest.CaptureFixture[str],
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    import displayboard.mister_control as mister_control
-
-    setup_mock = mock.MagicMock()
+    caplog.set_level(logging.INFO)
+    setup_mock = mock.create_autospec(mister_control.setup)
     monkeypatch.setattr(mister_control, "setup", setup_mock)
 
     def raise_interrupt(*args: object, **kwargs: object) -> None:
         raise KeyboardInterrupt
 
     monkeypatch.setattr(mister_control, "trigger_mister", raise_interrupt)
-    cleanup_mock = mock.MagicMock()
+    cleanup_mock = mock.create_autospec(mister_control.cleanup)
     monkeypatch.setattr(mister_control, "cleanup", cleanup_mock)
     mister_control.main()
     setup_mock.assert_called_once()
     cleanup_mock.assert_called_once()
-    out = capsys.readouterr().out
-    assert "Interrupted by user." in out
-    assert "GPIO cleaned up." in out
+    assert "Interrupted by user." in caplog.text
+    assert "GPIO cleaned up." in caplog.text
@@ -1,12 +1,43 @@
 from typing import Optional
-import sys
 import types
 import pytest
 import platform
+import shutil
+import subprocess
 import threading
+import time
+from unittest.mock import Mock
 import displayboard.video_loop as video_loop
 
 
+# Popen's attribute names, listed once. A list spec still rejects misspelt
+# attributes but spares each Mock a dir() and signature walk over Popen.
+_POPEN_ATTRS = dir(subprocess.Popen)
+
+
+class _FakePopen:
+    """A still-running process, for tests that never assert on Popen calls."""
+
+    __slots__ = ("pid", "returncode")
+
+    def __init__(self, pid: int = 12345) -> None:
+        self.pid = pid
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+
+def _noop(*args: object, **kwargs: object) -> None:
+    pass
+
+
+# Swallows every log call video_loop makes; shared by the tests that patch it in
+_NOOP_LOGGER = types.SimpleNamespace(
+    info=_noop, debug=_noop, error=_noop, warning=_noop
+)
+
+
 @pytest.fixture(autouse=True)
 def patch_config(monkeypatch: pytest.MonkeyPatch) -> None:
     class DummyConfig:
@@ -18,74 +49,59 @@ def patch_config(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(video_loop, "config", DummyConfig)
 
 
-@pytest.mark.parametrize("platform_name", ["Linux", "Darwin", "Windows"])
-def test_check_mpv_installed_linux_installed(
-    monkeypatch: pytest.MonkeyPatch, platform_name: str
-) -> None:
-    import shutil
-
-    monkeypatch.setattr(platform, "system", lambda: platform_name)
-    monkeypatch.setattr(shutil, "which", lambda x: "/usr/bin/mpv")
-    # Should not raise or exit
-    video_loop.check_mpv_installed()
+_MPV_MISSING = "❌ Error: MPV not installed."
 
 
-@pytest.mark.parametrize("platform_name", ["Linux", "Darwin", "Windows"])
-def test_check_mpv_installed_linux_not_installed(
-    monkeypatch: pytest.MonkeyPatch, platform_name: str
-) -> None:
-    import shutil
-
+@pytest.fixture
+def fake_platform(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> tuple[str, Optional[str]]:
+    """Fixes platform.system() and shutil.which() from an indirect parameter."""
+    platform_name, which_result = request.param
     monkeypatch.setattr(platform, "system", lambda: platform_name)
-    monkeypatch.setattr(shutil, "which", lambda x: None)
-    monkeypatch.setattr(
-        sys,
-        "exit",
-        lambda code=1: (_ for _ in ()).throw(SystemExit(code)),
-    )
-    if platform_name in ("Linux", "Darwin"):
-        with pytest.raises(SystemExit):
-            video_loop.check_mpv_installed()
-    else:
-        # Should not raise SystemExit for non-Linux platforms
-        video_loop.check_mpv_installed()
-
-
-@pytest.mark.parametrize("platform_name", ["Linux", "Darwin", "Windows"])
-def test_check_mpv_installed_non_linux(
-    monkeypatch: pytest.MonkeyPatch, platform_name: str
+    monkeypatch.setattr(shutil, "which", lambda x: which_result)
+    return platform_name, which_result
+
+
+@pytest.mark.parametrize(
+    "fake_platform, install_hint",
+    [
+        pytest.param(("Linux", "/usr/bin/mpv"), None, id="linux-installed"),
+        pytest.param(("Linux", None), "sudo apt install mpv", id="linux-missing"),
+        pytest.param(("Darwin", "/usr/local/bin/mpv"), None, id="darwin-installed"),
+        pytest.param(("Darwin", None), "brew install mpv", id="darwin-missing"),
+        # Other platforms skip the check entirely
+        pytest.param(("Windows", None), None, id="windows-missing"),
+    ],
+    indirect=["fake_platform"],
+)
+def test_check_mpv_installed(
+    capsys: pytest.CaptureFixture[str],
+    fake_platform: tuple[str, Optional[str]],
+    install_hint: Optional[str],
 ) -> None:
-    import shutil
-
-    monkeypatch.setattr(platform, "system", lambda: platform_name)
-    monkeypatch.setattr(shutil, "which", lambda x: "/usr/local/bin/mpv")
-    # Should not raise or exit
-    video_loop.check_mpv_installed()
+    if install_hint is None:
+        video_loop.check_mpv_installed()
+        assert capsys.readouterr().out == ""
+        return
+    with pytest.raises(SystemExit) as exc_info:
+        video_loop.check_mpv_installed()
+    assert exc_info.value.code == 1
+    printed = set(capsys.readouterr().out.splitlines())
+    assert {_MPV_MISSING, f"👉 Install it with: {install_hint}"} <= printed
 
 
 def test_handle_video_process_starts_new(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    dummy_proc = type("P", (), {"poll": lambda self: None, "pid": 12345})()
+    dummy_proc = _FakePopen()
     popen_called = {}
 
     def dummy_popen(cmd: str) -> object:
         popen_called["called"] = True
         return dummy_proc
 
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(
-            info=lambda *a, **k: None,
-            debug=lambda *a, **k: None,
-            error=lambda *a, **k: None,
-            warning=lambda *a, **k: None,
-        ),
-    )
-    import subprocess
-    import time
-
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     monkeypatch.setattr(subprocess, "Popen", dummy_popen)
     monkeypatch.setattr(video_loop, "subprocess", subprocess)
     monkeypatch.setattr(time, "sleep", lambda s: None)
@@ -101,8 +117,6 @@ def test_handle_video_process_file_not_found(
     def raise_fnf(cmd: str) -> None:
         raise FileNotFoundError()
 
-    import subprocess
-
     monkeypatch.setattr(subprocess, "Popen", raise_fnf)
     monkeypatch.setattr(video_loop, "subprocess", subprocess)
     proc = video_loop.handle_video_process(None)
@@ -112,48 +126,27 @@ def test_handle_video_process_file_not_found(
 def test_handle_video_process_called_process_error(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    called: dict[str, bool] = {}
+    error = subprocess.CalledProcessError(1, "mpv")
+    handled: list[tuple[object, Exception]] = []
 
-    def dummy_handle_process_error(process: object, e: Exception) -> None:
-        called["called"] = True
+    def raise_cpe(cmd: str) -> None:
+        raise error
 
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(
-            info=lambda *a, **k: None,
-            debug=lambda *a, **k: None,
-            error=lambda *a, **k: None,
-            warning=lambda *a, **k: None,
-        ),
+        video_loop, "handle_process_error", lambda p, e: handled.append((p, e))
     )
-    monkeypatch.setattr(video_loop, "handle_process_error", dummy_handle_process_error)
-
-    import subprocess
-
-    def raise_cpe(cmd: str) -> None:
-        raise subprocess.CalledProcessError(1, cmd)
-
     monkeypatch.setattr(subprocess, "Popen", raise_cpe)
     monkeypatch.setattr(video_loop, "subprocess", subprocess)
     video_loop.handle_video_process(None)
-    assert called["called"]
+    assert handled == [(None, error)]
 
 
 def test_handle_video_process_keyboard_interrupt(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     called: dict[str, bool] = {}
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(
-            info=lambda *a, **k: None,
-            debug=lambda *a, **k: None,
-            error=lambda *a, **k: None,
-            warning=lambda *a, **k: None,
-        ),
-    )
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     monkeypatch.setattr(
         video_loop,
         "handle_keyboard_interrupt",
@@ -163,8 +156,6 @@ def test_handle_video_process_keyboard_interrupt(
     def raise_ki(cmd: str) -> None:
         raise KeyboardInterrupt()
 
-    import subprocess
-
     monkeypatch.setattr(subprocess, "Popen", raise_ki)
     monkeypatch.setattr(video_loop, "subprocess", subprocess)
     proc = video_loop.handle_video_process(None)
@@ -176,11 +167,7 @@ def test_handle_video_process_unexpected(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     called: dict[str, bool] = {}
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(info=lambda *a, **k: None, error=lambda *a, **k: None),
-    )
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
 
     monkeypatch.setattr(
         video_loop,
@@ -191,8 +178,6 @@ def test_handle_video_process_unexpected(
     def raise_exc(cmd: str) -> None:
         raise RuntimeError("fail")
 
-    import subprocess
-
     monkeypatch.setattr(subprocess, "Popen", raise_exc)
     monkeypatch.setattr(video_loop, "subprocess", subprocess)
     video_loop.handle_video_process(None)
@@ -204,77 +189,47 @@ def test_handle_process_error(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
 
-    import subprocess
-
-    # Create a real Popen object using a harmless command
-    proc = subprocess.Popen(
-        [sys.executable, "-c", "import time; time.sleep(0.1)"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(error=lambda *a, **k: None),
-    )
-    import time
-
+    proc = Mock(spec=_POPEN_ATTRS)
+    proc.poll.return_value = None
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     monkeypatch.setattr(time, "sleep", lambda t: None)
-    try:
-        video_loop.handle_process_error(proc, Exception("fail"))
-        out = capsys.readouterr().out
-        assert "🔴 Error playing video" in out
-    finally:
-        proc.terminate()
-        proc.wait()
+    video_loop.handle_process_error(proc, Exception("fail"))
+    out = capsys.readouterr().out
+    assert "🔴 Error playing video" in out
+    proc.terminate.assert_called_once()
+    proc.wait.assert_called_once()
 
 
 def test_handle_keyboard_interrupt(
     capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    monkeypatch.setattr(
-        video_loop, "logger", types.SimpleNamespace(info=lambda *a, **k: None)
-    )
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     video_loop.handle_keyboard_interrupt()
     out = capsys.readouterr().out
     assert "👋 Exiting" in out
 
 
 def test_handle_unexpected_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    import subprocess
-
-    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
-    monkeypatch.setattr(
-        video_loop, "logger", types.SimpleNamespace(error=lambda *a, **k: None)
-    )
-    import time
-
+    proc = Mock(spec=_POPEN_ATTRS)
+    proc.poll.return_value = None
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     monkeypatch.setattr(time, "sleep", lambda t: None)
-    try:
-        video_loop.handle_unexpected_error(proc, Exception("fail"))
-    finally:
-        proc.terminate()
-        proc.wait()
+    video_loop.handle_unexpected_error(proc, Exception("fail"))
+    proc.terminate.assert_called_once()
+    proc.wait.assert_called_once()
 
 
 def test_cleanup_process_terminates(monkeypatch: pytest.MonkeyPatch) -> None:
-    import subprocess
-    from unittest.mock import Mock
-
     terminated: dict[str, bool] = {}
 
-    dummy_proc = Mock(spec=subprocess.Popen)
+    dummy_proc = Mock(spec=_POPEN_ATTRS)
     dummy_proc.poll.return_value = None
     dummy_proc.terminate.side_effect = lambda: terminated.setdefault("terminated", True)
     dummy_proc.wait.side_effect = lambda timeout=None: terminated.setdefault(
         "waited", True
     )
 
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None),
-    )
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     video_loop.cleanup_process(dummy_proc)
     assert terminated.get("terminated")
 
@@ -282,27 +237,20 @@ def test_cleanup_process_terminates(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_cleanup_process_kills_on_timeout(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    import subprocess
-    from unittest.mock import Mock
-
     killed: dict[str, bool] = {}
 
-    dummy_proc = Mock(spec=subprocess.Popen)
+    dummy_proc = Mock(spec=_POPEN_ATTRS)
     dummy_proc.poll.return_value = None
     dummy_proc.terminate.return_value = None
     dummy_proc.wait.side_effect = subprocess.TimeoutExpired(cmd="mpv", timeout=1)
     dummy_proc.kill.side_effect = lambda: killed.setdefault("killed", True)
 
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None),
-    )
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     video_loop.cleanup_process(dummy_proc)
     assert killed.get("killed")
 
     # Use Mock instead of DummyProc to match Popen signature and typing
-    dummy_proc2 = Mock(spec=subprocess.Popen)
+    dummy_proc2 = Mock(spec=_POPEN_ATTRS)
     dummy_proc2.poll.return_value = None
 
     def terminate() -> None:
@@ -318,22 +266,11 @@ def test_cleanup_process_kills_on_timeout(
     dummy_proc2.wait.side_effect = wait
     dummy_proc2.kill.side_effect = kill
 
-    monkeypatch.setattr(
-        video_loop,
-        "logger",
-        types.SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None),
-    )
+    monkeypatch.setattr(video_loop, "logger", _NOOP_LOGGER)
     video_loop.cleanup_process(dummy_proc2)
     assert killed.get("killed")
 
 
-def test_cleanup_process_none(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Should do nothing
-    video_loop.cleanup_process(None)
-    # This test is now covered by test_run_video_loop_runs_once using dummy_event
-    pass
-
-
 def test_run_video_loop_runs_once(
     monkeypatch: pytest.MonkeyPatch,
     dummy_event: threading.Event,
@@ -341,10 +278,7 @@ def test_run_video_loop_runs_once(
     """Covers run_video_loop running once and returning dummy_proc."""
     called: dict[str, bool] = {}
 
-    from unittest.mock import Mock
-    import subprocess
-
-    dummy_proc = Mock(spec=subprocess.Popen)
+    dummy_proc = _FakePopen()
 
     def handle_video_process(proc: object) -> object:
         if not called:
@@ -396,42 +330,19 @@ def test_run_video_loop_event_set(dummy_event: threading.Event) -> None:
 
 
 def test_handle_video_process_returns_existing() -> None:
-    import subprocess
-    from unittest.mock import Mock
-
-    proc = Mock(spec=subprocess.Popen)
-    proc.poll.return_value = None
+    proc = _FakePopen()
     # Should just return the same process
     assert video_loop.handle_video_process(proc) is proc
 
 
-def test_cleanup_process_none_and_poll(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    import subprocess
-    from unittest.mock import Mock
-
+def test_cleanup_process_none_and_poll() -> None:
     # Should do nothing if process is None
     video_loop.cleanup_process(None)
     # Should do nothing if poll() is not None
-    dummy_proc = Mock(spec=subprocess.Popen)
-    dummy_proc.poll.return_value = 1
-    video_loop.cleanup_process(dummy_proc)
-
-
-def test_cleanup_process_none_and_poll_2(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    # Should do nothing if process is None
-    video_loop.cleanup_process(None)
-
-    # Should do nothing if poll() is not None
-    import subprocess
-    from unittest.mock import Mock
-
-    dummy_proc = Mock(spec=subprocess.Popen)
+    dummy_proc = Mock(spec=_POPEN_ATTRS)
     dummy_proc.poll.return_value = 1
     video_loop.cleanup_process(dummy_proc)
+    dummy_proc.terminate.assert_not_called()
 
 
 def test_is_headless_environment_with_display(